@@ -17,6 +17,7 @@ __all__ = (
     'from_dict',
     'to_dict',
     'validate',
+    'validate_many',
 
     'Payload',
     'Profile',
@@ -12,11 +12,15 @@ Functions:
     to_dict: Converts a Payload object to a dictionary.
     from_dict: Converts a dictionary to a Payload object.
     validate: Validates a Payload object against proto and spec validation rules.
+    validate_many: Validates several Payload objects in parallel worker processes.
 """
 
 import hashlib
 import json
-from typing import BinaryIO
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterable, List, Optional
 
 from google.protobuf.json_format import MessageToJson, MessageToDict, Parse
 
@@ -26,6 +30,22 @@ from a7p import exceptions
 from a7p.spec_validator import validate_spec
 
 
+def _md5_digest(data: bytes) -> bytes:
+    """
+    Computes the MD5 checksum used as the .a7p file prefix.
+
+    MD5 serves only as an integrity check here, so it is requested as a
+    non-security hash.
+
+    Args:
+        data (bytes): The serialized payload, or a view of it.
+
+    Returns:
+        bytes: The raw 16-byte MD5 digest of the data.
+    """
+    return hashlib.new('md5', data, usedforsecurity=False).digest()
+
+
 def loads(string: bytes, validate_: bool = True, fail_fast: bool = False) -> profedit_pb2.Payload:
     """
     Deserializes byte data into a Payload object and validates it.
@@ -34,6 +54,7 @@ def loads(string: bytes, validate_: bool = True, fail_fast: bool = False) -> pro
         string (bytes): The serialized byte data, with an MD5 hash as a prefix.
         validate_ (bool): Flag indicating whether to validate the payload. Default is True.
         fail_fast (bool): Flag indicating whether to raise errors immediately on validation failure. Default is False.
+            See `validate` for what is reported.
 
     Returns:
         profedit_pb2.Payload: The deserialized Payload object.
@@ -42,9 +63,15 @@ def loads(string: bytes, validate_: bool = True, fail_fast: bool = False) -> pro
         A7PChecksumError: If the MD5 hash does not match the data.
         A7PValidationError: If validation fails.
     """
-    data = string[32:]
-    md5_hash = hashlib.md5(data).hexdigest()
-    if md5_hash == string[:32].decode():
+    # Hash and parse through a view to avoid copying the payload out of `string`,
+    # and compare raw digests instead of hex-encoding the computed one
+    data = memoryview(string)[32:]
+    md5_hash = _md5_digest(data)
+    try:
+        expected_hash = bytes.fromhex(string[:32].decode('ascii'))
+    except ValueError:
+        expected_hash = None
+    if md5_hash == expected_hash:
         payload = profedit_pb2.Payload()
         payload.ParseFromString(data)
         if validate_:
@@ -62,6 +89,7 @@ def load(file: BinaryIO, validate_: bool = True, fail_fast: bool = False) -> pro
         file (BinaryIO): The file-like object to read from.
         validate_ (bool): Flag indicating whether to validate the payload. Default is True.
         fail_fast (bool): Flag indicating whether to raise errors immediately on validation failure. Default is False.
+            See `validate` for what is reported.
 
     Returns:
         profedit_pb2.Payload: The deserialized Payload object.
@@ -89,10 +117,11 @@ def dumps(payload: profedit_pb2.Payload, validate_: bool = True, fail_fast: bool
     Raises:
         A7PValidationError: If validation fails.
     """
-    if validate_:
-        validate(payload, fail_fast)
     data = payload.SerializeToString()
-    md5_hash = hashlib.md5(data).hexdigest().encode()
+    if validate_:
+        # the serialized form is the validation cache key, so it is only built once
+        _validate_bytes(payload, data, fail_fast)
+    md5_hash = _md5_digest(data).hex().encode()
     return md5_hash + data
 
 
@@ -172,13 +201,53 @@ def from_dict(data: dict) -> profedit_pb2.Payload:
     return Parse(json.dumps(data), profedit_pb2.Payload())
 
 
+# Serialized payloads that recently passed validation, least recently used first.
+# Keys are the full serialized bytes, so a payload mutated after validation gets a new key
+# and is validated again. Failed validations are never cached.
+_VALID_CACHE_MAXSIZE = 32
+_valid_cache: 'OrderedDict[bytes, None]' = OrderedDict()
+_valid_cache_lock = threading.Lock()
+
+
+def _is_known_valid(data: bytes) -> bool:
+    """
+    Checks whether the serialized payload recently passed validation.
+
+    Args:
+        data (bytes): The serialized payload.
+
+    Returns:
+        bool: True if the same bytes passed validation recently.
+    """
+    with _valid_cache_lock:
+        if data in _valid_cache:
+            _valid_cache.move_to_end(data)
+            return True
+    return False
+
+
+def _remember_valid(data: bytes) -> None:
+    """
+    Records the serialized payload as valid, evicting the least recently used entry if needed.
+
+    Args:
+        data (bytes): The serialized payload that passed validation.
+    """
+    with _valid_cache_lock:
+        _valid_cache[data] = None
+        if len(_valid_cache) > _VALID_CACHE_MAXSIZE:
+            _valid_cache.popitem(last=False)
+
+
 def validate(payload: profedit_pb2.Payload, fail_fast: bool = False) -> None:
     """
     Validates a Payload object against proto and spec validation rules.
+    Payloads whose serialized form recently passed validation are accepted without re-checking.
 
     Args:
         payload (profedit_pb2.Payload): The Payload object to validate.
         fail_fast (bool): Flag indicating whether to raise errors immediately on validation failure. Default is False.
+            A proto violation is raised right away, spec violations are always reported in full.
 
     Returns:
         None
@@ -188,40 +257,62 @@ def validate(payload: profedit_pb2.Payload, fail_fast: bool = False) -> None:
         A7PSpecValidationError: If there are spec validation errors.
         A7PValidationError: If there are any violations.
     """
-    violations = {
-        'violations': []
-    }
+    _validate_bytes(payload, payload.SerializeToString(), fail_fast)
 
-    is_errors = False
 
-    try:
-        protovalidate.validate(payload)
-    except protovalidate.ValidationError as err:
+def _validate_bytes(payload: profedit_pb2.Payload, data: bytes, fail_fast: bool) -> None:
+    """
+    Validates a Payload object whose serialized form the caller already has, see `validate`.
+
+    Args:
+        payload (profedit_pb2.Payload): The Payload object to validate.
+        data (bytes): The serialized Payload, used as the key of the recently validated payloads.
+        fail_fast (bool): Flag indicating whether to raise errors immediately on validation failure.
+
+    Raises:
+        A7PProtoValidationError: If there are proto validation errors.
+        A7PSpecValidationError: If there are spec validation errors.
+        A7PValidationError: If there are any violations.
+    """
+    if _is_known_valid(data):
+        return
+
+    # Nothing is allocated for the aggregated error unless a check actually fails,
+    # so a well-formed payload goes through both validators without extra work
+    violations = None
+    proto_violations = None
+    spec_violations = None
+
+    # Collect proto violations directly instead of raising and catching
+    # protovalidate.ValidationError just to read them back
+    proto_result = protovalidate.collect_violations(payload)
+    if proto_result.violations:
         proto_error = exceptions.A7PProtoValidationError(
             "Proto validation error",
             payload,
-            err.violations
+            proto_result
         )
         if fail_fast:
             raise proto_error
-        is_errors = True
-        violations['proto_violations'] = proto_error.proto_violations
-        violations['violations'].append(
+        proto_violations = proto_error.proto_violations
+        violations = [
             exceptions.Violation(
                 "Proto validation error",
                 "Validation failed during proto validation",
                 ""
             )
-        )
+        ]
 
     try:
         validate_spec(payload)
     except exceptions.A7PSpecValidationError as err:
         if fail_fast:
-            raise err
-        is_errors = True
-        violations['spec_violations'] = err.spec_violations
-        violations['violations'].append(
+            # re-raised as is, the error already carries the payload and violations
+            raise
+        spec_violations = err.spec_violations
+        if violations is None:
+            violations = []
+        violations.append(
             exceptions.Violation(
                 "Spec validation error",
                 "Validation failed during spec validation",
@@ -230,15 +321,66 @@ def validate(payload: profedit_pb2.Payload, fail_fast: bool = False) -> None:
         )
 
     # Raise the final validation error if there are violations
-    if is_errors:
+    if violations is not None:
         raise exceptions.A7PValidationError(
             "Validation error",
             payload,
-            violations=violations['violations'],  # Загальний список порушень
-            proto_violations=violations.get('proto_violations'),
-            spec_violations=violations.get('spec_violations')
+            violations=violations,  # Загальний список порушень
+            proto_violations=proto_violations,
+            spec_violations=spec_violations
         )
 
+    _remember_valid(data)
+
+
+def _validate_serialized(data: bytes, fail_fast: bool) -> Optional[exceptions.A7PValidationError]:
+    """
+    Parses and validates a serialized payload in a worker process.
+
+    Args:
+        data (bytes): The serialized Payload, without the MD5 prefix.
+        fail_fast (bool): Flag passed through to `validate`.
+
+    Returns:
+        Optional[A7PValidationError]: The validation error, or None if the payload is valid.
+    """
+    payload = profedit_pb2.Payload()
+    payload.ParseFromString(data)
+    try:
+        validate(payload, fail_fast)
+    except exceptions.A7PValidationError as err:
+        # the caller already has the payload, so it isn't sent back
+        err.payload = None
+        return err
+    return None
+
+
+def validate_many(payloads: Iterable[profedit_pb2.Payload], fail_fast: bool = False,
+                  max_workers: Optional[int] = None) -> List[Optional[exceptions.A7PValidationError]]:
+    """
+    Validates several Payload objects in parallel worker processes.
+
+    Args:
+        payloads (Iterable[profedit_pb2.Payload]): The Payload objects to validate.
+        fail_fast (bool): Flag indicating whether to raise errors immediately on validation failure. Default is False.
+        max_workers (Optional[int]): Maximum number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        List[Optional[A7PValidationError]]: For each payload in order, its validation error or None if it is valid.
+            The errors reference the original payload objects.
+    """
+    payloads = list(payloads)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        errors = list(executor.map(
+            _validate_serialized,
+            [payload.SerializeToString() for payload in payloads],
+            [fail_fast] * len(payloads),
+        ))
+    for payload, err in zip(payloads, errors):
+        if err is not None:
+            err.payload = payload
+    return errors
+
 
 __all__ = (
     'loads',
@@ -250,6 +392,7 @@ __all__ = (
     'from_dict',
     'to_dict',
     'validate',
+    'validate_many',
 )
 
 if __name__ == '__main__':
@@ -22,8 +22,9 @@ Functions:
 """
 
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Type
+from typing import Type, Iterator
 
 from a7p.buf.validate import expression_pb2
 from a7p import profedit_pb2
@@ -40,6 +41,8 @@ class Violation:
         value (any): The value that caused the violation.
         reason (str): A description of why the violation occurred.
     """
+    # declared by hand, dataclass(slots=True) needs Python 3.10
+    __slots__ = ('path', 'value', 'reason')
 
     path: Path | str
     value: any
@@ -66,7 +69,7 @@ class ProtoViolation(Violation):
 
     Inherits all attributes and methods from Violation.
     """
-    pass
+    __slots__ = ()
     # def __init__(self, path: str, value: any, reason: str) -> None:
     #     self.path = Path("~/", *path.split("."))
     #     self.value = value
@@ -80,7 +83,7 @@ class SpecViolation(Violation):
 
     Inherits all attributes and methods from Violation.
     """
-    pass
+    __slots__ = ()
 
 
 class A7PError(RuntimeError):
@@ -138,6 +141,15 @@ class A7PValidationError(A7PDataError):
         self.proto_violations = proto_violations or []
         self.spec_violations = spec_violations or []
 
+    def iter_violations(self) -> Iterator[Violation]:
+        """
+        Iterates over all types of violations without building a combined list.
+
+        Returns:
+            Iterator[Violation]: General, protocol and specification violations, in that order.
+        """
+        return chain(self.violations, self.proto_violations, self.spec_violations)
+
     @property
     def all_violations(self) -> list[Violation]:
         """
@@ -146,7 +158,41 @@ class A7PValidationError(A7PDataError):
         Returns:
             list[Violation]: A combined list of violations.
         """
-        return self.violations + self.proto_violations + self.spec_violations
+        return list(self.iter_violations())
+
+    def __reduce__(self):
+        """
+        Supports pickling, so errors can be returned from worker processes.
+
+        Subclasses take different constructor arguments, so the error is rebuilt
+        from its message and attributes instead of calling __init__ again.
+        The payload is carried in its serialized form.
+        """
+        state = dict(self.__dict__)
+        payload = state.get('payload')
+        if isinstance(payload, profedit_pb2.Payload):
+            state['payload'] = payload.SerializeToString()
+        return _restore_validation_error, (type(self), self.args, state)
+
+
+def _restore_validation_error(cls: Type[A7PValidationError], args: tuple, state: dict) -> A7PValidationError:
+    """
+    Rebuilds a pickled A7PValidationError or one of its subclasses.
+
+    Args:
+        cls (Type[A7PValidationError]): The error class.
+        args (tuple): The exception arguments.
+        state (dict): The error attributes, with the payload in its serialized form.
+
+    Returns:
+        A7PValidationError: The restored error.
+    """
+    err = cls.__new__(cls)
+    Exception.__init__(err, *args)
+    err.__dict__.update(state)
+    if isinstance(err.payload, bytes):
+        err.payload = profedit_pb2.Payload.FromString(err.payload)
+    return err
 
 
 class A7PProtoValidationError(A7PValidationError):
@@ -270,15 +316,9 @@ def _extract_protovalidate_violations(violations: expression_pb2.Violations) ->
     if not isinstance(violations, expression_pb2.Violations):
         raise TypeError("Expected an instance of expression_pb2.Violations, but got a different type.")
 
-    extracted_violations = []
-    for field, value in violations.ListFields():
-        if field.name == "violations":  # Ensure we are handling the violations field
-            for violation in value:  # Iterate over each Violation object
-                extracted_violations.append(
-                    _extract_violation(violation)
-                )  # Pass the violation to the function
-
-    return extracted_violations  # Ensure the violations are returned
+    # the repeated field is read directly instead of scanning ListFields() for it,
+    # an unset field reads as an empty list
+    return [_extract_violation(violation) for violation in violations.violations]
 
 
 __all__ = [
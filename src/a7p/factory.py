@@ -231,7 +231,8 @@ class A7PFactory:
         def fmt_bottom():
             if meta.short_name_bot:
                 return meta.short_name_bot
-            return "{:.{}f}".format(bullet.weight, 0 if bullet.weight % 1 == 0 else 1) + 'gr'
+            # float() as weight may also be given as an int, which has no is_integer() before 3.12
+            return "{:.{}f}".format(bullet.weight, 0 if float(bullet.weight).is_integer() else 1) + 'gr'
 
         def drag_model():
             return [
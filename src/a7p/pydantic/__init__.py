@@ -1,2 +1,2 @@
 from .models import Payload
-from .validate import validate, recover
\ No newline at end of file
+from .validate import validate, validate_dict, recover
\ No newline at end of file
@@ -1,9 +1,9 @@
 import math
-from functools import wraps
-from typing import Callable, Optional, Any
+from functools import wraps, lru_cache
+from typing import Callable, Optional, Any, NamedTuple
 
 from annotated_types import Interval, MultipleOf
-from pydantic import StringConstraints
+from pydantic import StringConstraints, Strict, AllowInfNan
 from pydantic_core.core_schema import FieldValidationInfo
 from typing_extensions import get_args
 from a7p.logger import logger
@@ -77,6 +77,44 @@ def pre_validate_conint(
     return validate
 
 
+def is_valid_conint(
+        type_: type, strict: bool, interval: Optional[Interval], multiple_of: Optional[MultipleOf]
+) -> Callable[[Any], bool]:
+    """
+    Returns a non-raising check for values that already satisfy the integer constraints as they are.
+
+    It is a conservative counterpart of `pre_validate_conint`: a value it accepts passes
+    the validator unchanged, anything else has to go through the validator,
+    which either converts it or raises the error.
+
+    Args:
+        type_ (type): The type to check against.
+        strict (bool): Whether strict type checking is enabled.
+        interval (Optional[Interval]): The interval constraints to check.
+        multiple_of (Optional[MultipleOf]): The multiple of constraint to check.
+
+    Returns:
+        Callable[[Any], bool]: A function returning True if the value is valid as is.
+    """
+    ge = interval.ge if interval is not None else None
+    le = interval.le if interval is not None else None
+    gt = interval.gt if interval is not None else None
+    lt = interval.lt if interval is not None else None
+    divisor = multiple_of.multiple_of if multiple_of is not None else None
+
+    def check(value: Any) -> bool:
+        return (
+            type(value) is type_
+            and (ge is None or value >= ge)
+            and (le is None or value <= le)
+            and (gt is None or value > gt)
+            and (lt is None or value < lt)
+            and (divisor is None or value % divisor == 0)
+        )
+
+    return check
+
+
 def pre_validate_confloat(
         type_: type, strict: bool, interval: Optional[Interval], multiple_of: Optional[MultipleOf], allow_inf_nan: bool
 ) -> Callable[[Any], Any]:
@@ -141,9 +179,71 @@ def pre_validate_constr(type_: type, str_constraints: Optional[StringConstraints
     return validate
 
 
+class FieldConstraints(NamedTuple):
+    """
+    Constraints collected from the metadata of a `typing.Annotated` field type.
+
+    Attributes:
+        type_ (type): The annotated base type.
+        strict (Optional[Strict]): The strict mode marker, if any.
+        interval (Optional[Interval]): The interval constraints, if any.
+        multiple_of (Optional[MultipleOf]): The multiple of constraint, if any.
+        allow_inf_nan (Optional[AllowInfNan]): The NaN/Infinity marker, if any.
+        str_constraints (Optional[StringConstraints]): The string constraints, if any.
+    """
+    type_: type
+    strict: Optional[Strict] = None
+    interval: Optional[Interval] = None
+    multiple_of: Optional[MultipleOf] = None
+    allow_inf_nan: Optional[AllowInfNan] = None
+    str_constraints: Optional[StringConstraints] = None
+
+
+# metadata class -> FieldConstraints attribute it is collected into
+_CONSTRAINT_KINDS = (
+    (Strict, "strict"),
+    (Interval, "interval"),
+    (MultipleOf, "multiple_of"),
+    (AllowInfNan, "allow_inf_nan"),
+    (StringConstraints, "str_constraints"),
+)
+
+
+def get_field_constraints(field: Any) -> FieldConstraints:
+    """
+    Collects the constraints of a `typing.Annotated` field type by their kind, so both
+    `Annotated[int, Interval(...)]` aliases and the `conint`/`constr` forms are supported.
+
+    Args:
+        field (Any): The annotated field type.
+
+    Returns:
+        FieldConstraints: The base type and the constraints found in the metadata.
+
+    Raises:
+        TypeError: If the field type is not annotated.
+    """
+    args = get_args(field)
+    try:
+        type_ = args[0]
+    except IndexError:
+        raise TypeError(f"typing.Annotated should have at least one item")
+
+    found = {}
+    for item in args[1:]:
+        for kind, name in _CONSTRAINT_KINDS:
+            if isinstance(item, kind):
+                found[name] = item
+                break
+    return FieldConstraints(type_, **found)
+
+
+@lru_cache(maxsize=None)
 def retrieve_confield_validator(cls: type, field_name: str) -> Callable[[Any], Any]:
     """
     Retrieves the field validator for a given field in a class.
+    Field annotations don't change after class creation, so the validator is built
+    once per class and field and reused on every validation.
 
     Args:
         cls (type): The class containing the field.
@@ -160,20 +260,17 @@ def retrieve_confield_validator(cls: type, field_name: str) -> Callable[[Any], A
     if field is None:
         raise AttributeError(f"Field '%s' is not defined" % field_name)
 
-    args = get_args(field)
-
-    try:
-        type_ = args[0]
-    except IndexError:
-        raise TypeError(f"typing.Annotated should have at least one item")
+    constraints = get_field_constraints(field)
+    type_ = constraints.type_
 
     try:
         if type_ is int:
-            return pre_validate_conint(*args)
+            return pre_validate_conint(type_, constraints.strict, constraints.interval, constraints.multiple_of)
         elif type_ is float:
-            return pre_validate_confloat(*args)
+            return pre_validate_confloat(type_, constraints.strict, constraints.interval, constraints.multiple_of,
+                                         constraints.allow_inf_nan)
         elif type_ is str:
-            return pre_validate_constr(*args)
+            return pre_validate_constr(type_, constraints.str_constraints)
         else:
             raise TypeError(f"Can't validate field type '%s'" % type_)
     except TypeError as err:
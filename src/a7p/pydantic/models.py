@@ -1,11 +1,15 @@
+from collections import Counter
 from enum import Enum
-from typing import Any, get_args
+from typing import Any, Literal
 
-from pydantic import BaseModel, ValidationError, conint, constr, conlist, BeforeValidator, field_validator
+from annotated_types import Interval
+from pydantic import BaseModel, ValidationError, conlist, BeforeValidator, field_validator, Strict, \
+    StringConstraints
 from pydantic_core.core_schema import FieldValidationInfo
 from typing_extensions import List, Union, Annotated
 
-from a7p.pydantic.correction import on_restore, trigger_confield_validation, pre_validate_conint
+from a7p.pydantic.correction import on_restore, trigger_confield_validation, pre_validate_conint, is_valid_conint, \
+    get_field_constraints
 from a7p.pydantic.template import PAYLOAD_RECOVERY_SCHEMA
 
 
@@ -17,6 +21,11 @@ def validate_c_idx(v):
     return v
 
 
+DISTANCE_FROM_CHOICES = frozenset(('value', 'index'))
+# the names as the payload dictionary spells them, matched before falling back to lower()
+DISTANCE_FROM_NAMES = frozenset(('VALUE', 'INDEX'))
+
+
 def validate_distance_from(v):
     if isinstance(v, int):
         # Ensure the integer is within the allowed range
@@ -24,7 +33,7 @@ def validate_distance_from(v):
             raise ValueError("distance_from must be between 0 and 255 if it's an integer.")
     elif isinstance(v, str):
         # Ensure the string is 'VALUE'
-        if v.lower() not in ['value', 'index']:
+        if v not in DISTANCE_FROM_NAMES and v.lower() not in DISTANCE_FROM_CHOICES:
             raise ValueError("distance_from must be 'VALUE' if it's a string.")
     else:
         raise ValueError("distance_from must be either an integer in range 0-255 or the string 'VALUE' or 'INDEX'.")
@@ -60,11 +69,21 @@ class TwistDir(Enum):
     LEFT = "LEFT"
 
 
+# the fields hold the plain names, pydantic-core checks a Literal without the Enum lookup
+BCTypeName = Literal["G1", "G7", "CUSTOM"]
+TwistDirName = Literal["RIGHT", "LEFT"]
+
+TWIST_DIRS = (TwistDir.RIGHT.value, TwistDir.LEFT.value)
+BC_TYPES = (BCType.G1.value, BCType.G7.value, BCType.CUSTOM.value)
+STD_BC_TYPES = (BCType.G1.value, BCType.G7.value)
+CUSTOM_BC_TYPE = BCType.CUSTOM.value
+
+
 class Switch(BaseModel):
     c_idx: Annotated[int, BeforeValidator(validate_c_idx)]
-    zoom: conint(ge=0, le=6)
-    distance: conint(ge=int(1.0 * 100), le=int(3000.0 * 100))
-    reticle_idx: conint(ge=0, le=255)
+    zoom: Annotated[int, Interval(ge=0, le=6)]
+    distance: Annotated[int, Interval(ge=int(1.0 * 100), le=int(3000.0 * 100))]
+    reticle_idx: Annotated[int, Interval(ge=0, le=255)]
     distance_from: Annotated[Union[int, str], BeforeValidator(validate_distance_from)]
 
 
@@ -74,13 +93,13 @@ class CoefRows(BaseModel):
 
 
 class CdMaRows(CoefRows):
-    bc_cd: conint(ge=int(0.0 * 10000), le=int(10.0 * 10000))
-    mv: conint(ge=int(0.0 * 10000), le=int(10.0 * 10000))
+    bc_cd: Annotated[int, Interval(ge=int(0.0 * 10000), le=int(10.0 * 10000))]
+    mv: Annotated[int, Interval(ge=int(0.0 * 10000), le=int(10.0 * 10000))]
 
 
 class BcMvRows(CoefRows):
-    bc_cd: conint(ge=int(0.0 * 10000), le=int(10.0 * 10000))
-    mv: conint(ge=int(0.0 * 10), le=int(3000.0 * 10))
+    bc_cd: Annotated[int, Interval(ge=int(0.0 * 10000), le=int(10.0 * 10000))]
+    mv: Annotated[int, Interval(ge=int(0.0 * 10), le=int(3000.0 * 10))]
 
 
 class ProfileValidationError(ValueError):
@@ -89,34 +108,42 @@ class ProfileValidationError(ValueError):
         self.errors = errors
 
 
-LongString = constr(max_length=50)
-ShortString = constr(max_length=8)
-Text = constr(max_length=1024)
+LongString = Annotated[str, StringConstraints(max_length=50)]
+ShortString = Annotated[str, StringConstraints(max_length=8)]
+Text = Annotated[str, StringConstraints(max_length=1024)]
 
-SightHeight = conint(ge=-5000, le=5000)
-Twist = conint(ge=0, le=100 * 100)
+SightHeight = Annotated[int, Interval(ge=-5000, le=5000)]
+Twist = Annotated[int, Interval(ge=0, le=100 * 100)]
 
-Velocity = conint(ge=-10 * 10, le=3000 * 10)
-TCoeff = conint(ge=0, le=5 * 1000)
+Velocity = Annotated[int, Interval(ge=-10 * 10, le=3000 * 10)]
+TCoeff = Annotated[int, Interval(ge=0, le=5 * 1000)]
 
-Zeroing = conint(ge=-200 * 1000, le=200 * 1000)
-Temperature = conint(ge=-100, le=100)
-Pressure = conint(ge=300 * 10, le=1500 * 10)
-Humidity = conint(ge=0, le=100)
-Pitch = conint(ge=-90 * 10, le=90 * 10)
+Zeroing = Annotated[int, Interval(ge=-200 * 1000, le=200 * 1000)]
+Temperature = Annotated[int, Interval(ge=-100, le=100)]
+Pressure = Annotated[int, Interval(ge=300 * 10, le=1500 * 10)]
+Humidity = Annotated[int, Interval(ge=0, le=100)]
+Pitch = Annotated[int, Interval(ge=-90 * 10, le=90 * 10)]
 
-Diameter = conint(ge=int(0.001 * 1000), le=int(50.0 * 1000))
-Weight = conint(ge=int(1.0 * 10), le=int(6553.5 * 10))
-Length = conint(ge=int(0.01 * 1000), le=int(200.0 * 1000))
+Diameter = Annotated[int, Interval(ge=int(0.001 * 1000), le=int(50.0 * 1000))]
+Weight = Annotated[int, Interval(ge=int(1.0 * 10), le=int(6553.5 * 10))]
+Length = Annotated[int, Interval(ge=int(0.01 * 1000), le=int(200.0 * 1000))]
 
 SwitchesList = conlist(Switch, min_length=4)
-Distance = conint(ge=int(1.0 * 100), le=int(3000.0 * 100))
+Distance = Annotated[int, Interval(ge=int(1.0 * 100), le=int(3000.0 * 100))]
 DistancesList = conlist(Distance, min_length=1, max_length=200)
 
-DistanceIdx = conint(ge=0, le=200, strict=True)
+_distance_constraints = get_field_constraints(Distance)
+is_valid_distance = is_valid_conint(int, _distance_constraints.strict, _distance_constraints.interval,
+                                    _distance_constraints.multiple_of)
+validate_distance = pre_validate_conint(int, _distance_constraints.strict, _distance_constraints.interval,
+                                        _distance_constraints.multiple_of)
+
+DistanceIdx = Annotated[int, Strict(), Interval(ge=0, le=200)]
 ZeroDistanceIdx = DistanceIdx
 # CoefRowsList = Annotated[Union[List[BcMvRows], List[CdMaRows]], BeforeValidator(validate_coef_rows_based_on_bc_type)]
-CoefRowsList = Union[List[BcMvRows], List[CdMaRows]]
+# validate_coef_rows_based_on_bc_type already picks BcMvRows or CdMaRows by bc_type,
+# so the field takes the common base instead of letting a union try both list types
+CoefRowsList = List[CoefRows]
 
 DEFAULT_DISTANCES = PAYLOAD_RECOVERY_SCHEMA['profile']['distances']
 DEFAULT_SWITCHES = PAYLOAD_RECOVERY_SCHEMA['profile']['switches']
@@ -141,7 +168,7 @@ class Profile(BaseModel):
     # barrel params
     sc_height: SightHeight
     r_twist: Twist
-    twist_dir: TwistDir
+    twist_dir: TwistDirName
 
     # muzzle velocity
     c_muzzle_velocity: Velocity
@@ -163,7 +190,7 @@ class Profile(BaseModel):
     switches: SwitchesList
     distances: DistancesList
     c_zero_distance_idx: ZeroDistanceIdx
-    bc_type: BCType
+    bc_type: BCTypeName
     coef_rows: CoefRowsList
 
     @field_validator('profile_name',
@@ -248,7 +275,7 @@ class Profile(BaseModel):
     @field_validator('twist_dir', mode='before')
     @on_restore(handler=restore_default(TwistDir.RIGHT.value))
     def validate_twist_dir(cls, value, info: FieldValidationInfo):
-        if value not in [TwistDir.RIGHT, TwistDir.LEFT]:
+        if value not in TWIST_DIRS:
             raise ValueError("Input should be 'RIGHT' or 'LEFT'")
         return value
 
@@ -265,15 +292,23 @@ class Profile(BaseModel):
             raise ValueError("List should have at most 200 items after validation, not  %s" % len(value))
 
         if len(value) != len(set(value)):
-            repeated_items = list(set([item for item in value if value.count(item) > 1]))
+            # count occurrences in one pass instead of calling list.count for every item
+            counts = Counter(value)
+            repeated_items = list({item for item in value if counts[item] > 1})
 
             raise ValueError("Non unique values found in a list %s" % repeated_items)
 
-        validator = pre_validate_conint(*get_args(Distance))
+        # a list of plain ints is range checked by a single min()/max() pass in C
+        if set(map(type, value)) == {int} and is_valid_distance(min(value)) and is_valid_distance(max(value)):
+            return value
 
+        # valid items are accepted by a plain predicate, the raising validator
+        # only runs for the items that need a conversion or an error message
         for d in value:
+            if is_valid_distance(d):
+                continue
             try:
-                validator(d)
+                validate_distance(d)
             except (TypeError, ValueError) as err:
                 raise ValueError("Invalid values found: %s" % err)
 
@@ -302,26 +337,27 @@ class Profile(BaseModel):
     @field_validator('switches', mode='before')
     @on_restore(handler=restore_default(DEFAULT_SWITCHES))
     def validate_switches(cls, value, info: FieldValidationInfo):
-        value.append(value[0])
-        value[0]['c_idx'] = 500
         if not isinstance(value, list):
             raise ValueError("Input should be a valid list")
 
         if len(value) < 4:
             raise ValueError("List should have at least 4 item after validation, not %s" % len(value))
 
+        # Return the validated models, so pydantic doesn't validate every switch again
+        # when it checks the field against SwitchesList
+        switches = []
         for item in value:
             try:
-                Switch.model_validate(item, context=info.context)
+                switches.append(Switch.model_validate(item, context=info.context))
             except ValidationError as err:
                 raise ValueError("Invalid values found: %s" % err)
 
-        return value
+        return switches
 
     @field_validator('bc_type', mode='before')
-    @on_restore(handler=restore_default(BCType.G7))
+    @on_restore(handler=restore_default(BCType.G7.value))
     def validate_bc_type(cls, value, info: FieldValidationInfo):
-        if value not in [BCType.G1, BCType.G7, BCType.CUSTOM]:
+        if value not in BC_TYPES:
             raise ValueError("Input should be 'G1', 'G7' or 'CUSTOM'")
         return value
 
@@ -330,38 +366,38 @@ class Profile(BaseModel):
     def validate_coef_rows_based_on_bc_type(cls, value, info: FieldValidationInfo):
         # Convert dictionaries to model instances based on bc_type
         bc_type = info.data.get('bc_type')
-        value[0]['bc_cd'] = 300000
-        try:
-            if bc_type in [BCType.G1, BCType.G7]:
-                if len(value) < 1:
-                    raise ValueError('coef_rows should have at least 1 item when bc_type is %s' % bc_type)
-                if len(value) > 5:
-                    raise ValueError('coef_rows should have maximum 5 items when bc_type is %s' % bc_type)
-
-                # Ensure coef_rows contains BcMvRows instances
-                value = [BcMvRows(**row) if isinstance(row, dict) else row for row in value]
-                if not all(isinstance(row, BcMvRows) for row in value):
-                    raise ValueError(f'coef_rows must contain BcMvRows when bc_type is %s' % bc_type)
-            elif bc_type == BCType.CUSTOM:
-
-                if len(value) < 1:
-                    raise ValueError('coef_rows should have at least 1 item when bc_type is {bc_type}')
-                if len(value) > 200:
-                    raise ValueError('coef_rows should have maximum 200 items when bc_type is {bc_type}')
-
-                # Ensure coef_rows contains CdMaRows instances
-                value = [CdMaRows(**row) if isinstance(row, dict) else row for row in value]
-                if not all(isinstance(row, CdMaRows) for row in value):
-                    raise ValueError(f'coef_rows must contain CdMaRows when bc_type is %s' % bc_type)
-            else:
-                raise ValueError(f"Unsupported bc_type: %s" % bc_type)
 
+        # bc_type failed its own validation, rows can't be checked against an unknown type
+        if bc_type is None:
+            raise ValueError("coef_rows cannot be valid if bc_type is invalid or missing")
+
+        # pick the row model once, instead of re-checking bc_type for every row
+        if bc_type in STD_BC_TYPES:
+            row_cls, max_rows = BcMvRows, 5
+        elif bc_type == CUSTOM_BC_TYPE:
+            row_cls, max_rows = CdMaRows, 200
+        else:
+            raise ValueError(f"Unsupported bc_type: %s" % bc_type)
+
+        if len(value) < 1:
+            raise ValueError('coef_rows should have at least 1 item when bc_type is %s' % bc_type)
+        if len(value) > max_rows:
+            raise ValueError('coef_rows should have maximum %s items when bc_type is %s' % (max_rows, bc_type))
+
+        rows = []
+        try:
+            for row in value:
+                if isinstance(row, dict):
+                    row = row_cls(**row)
+                elif not isinstance(row, row_cls):
+                    raise ValueError(f'coef_rows must contain %s when bc_type is %s' % (row_cls.__name__, bc_type))
+                rows.append(row)
         except ValidationError as e:
             # raise e
             # Handle the validation error gracefully
             raise ValueError(f"Validation error while processing coef_rows for bc_type %s" % bc_type)
 
-        return value
+        return rows
 
 
 class Payload(BaseModel):
@@ -25,13 +25,15 @@ def main():
     with open(file_path.absolute(), 'rb') as fp:
         payload = a7p.load(fp, validate_=False)
 
-        model, restored, violations = pydantic.validate(payload)
+        # converted once, both validation passes read the same dict
+        payload_dict = a7p.to_dict(payload)
+        model, restored, violations = pydantic.validate_dict(payload_dict)
         for v in violations:
             color_print(v.format(), levelname="WARNING")
 
         if violations:
             logger.info("Started restore process")
-            model, restored, violations = pydantic.validate(payload, restore=True)
+            model, restored, violations = pydantic.validate_dict(payload_dict, restore=True)
             for r in restored:
                 r.print()
 
@@ -44,7 +46,7 @@ def main():
                 with open(file_path.with_stem(file_path.stem + "_restored"), 'wb') as fp:
                     restored_payload = a7p.from_dict(dump)
                     a7p.dump(restored_payload, fp)
-p
+
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 from pydantic import ValidationError
@@ -5,12 +6,18 @@ from typing_extensions import List, Dict
 
 import a7p
 from a7p import exceptions, profedit_pb2
-from a7p.pydantic.models import Payload
+from a7p.pydantic.models import Payload, Profile, Switch, BcMvRows, CdMaRows, CUSTOM_BC_TYPE
 from a7p.pydantic.template import PAYLOAD_RECOVERY_SCHEMA
 
 
+@lru_cache(maxsize=256)
+def _split_field_path(field_path: str) -> tuple:
+    # the same few paths are resolved over and over during restore, split each one once
+    return tuple(field_path.split('.'))
+
+
 def get_dict_field(payload_dict: Dict[str, Any], field_path: str):
-    loc = field_path.split('.')
+    loc = _split_field_path(field_path)
     current = payload_dict
 
     for part in loc:
@@ -26,7 +33,7 @@ def get_dict_field(payload_dict: Dict[str, Any], field_path: str):
 
 
 def set_dict_field(payload_dict: Dict[str, Any], field_path: str, value: Any):
-    loc = field_path.split('.')  # Split path into components
+    loc = _split_field_path(field_path)  # Split path into components
     current = payload_dict
 
     # Traverse the path until the second-to-last part
@@ -47,8 +54,28 @@ def set_dict_field(payload_dict: Dict[str, Any], field_path: str, value: Any):
         current[last_part] = value
 
 
-def validate(payload: profedit_pb2.Payload, restore=False):
-    payload_dict = a7p.to_dict(payload)
+def construct(payload_dict: Dict[str, Any]) -> Payload:
+    # builds the models without running any validator, for data that is already known
+    # to be valid, e.g. produced by the recovery pass; nested rows are built as well,
+    # so the model dumps the same way as a validated one
+    profile = dict(payload_dict['profile'])
+    row_cls = CdMaRows if profile['bc_type'] == CUSTOM_BC_TYPE else BcMvRows
+    profile['switches'] = [Switch.model_construct(**switch) for switch in profile['switches']]
+    profile['coef_rows'] = [row_cls.model_construct(**row) for row in profile['coef_rows']]
+    return Payload.model_construct(profile=Profile.model_construct(**profile))
+
+
+def validate(payload: profedit_pb2.Payload, restore=False, trusted=False):
+    return validate_dict(a7p.to_dict(payload), restore=restore, trusted=trusted)
+
+
+def validate_dict(payload_dict: Dict[str, Any], restore=False, trusted=False):
+    # the dict is only read, so callers validating the same payload several times
+    # (e.g. before and after restore) can convert it once and pass it here
+    if trusted:
+        # trusted data skips validation, there is nothing to restore or report
+        return construct(payload_dict), [], []
+
     context = {
         "restore": restore,
         "restored": []
@@ -77,16 +104,20 @@ def validate(payload: profedit_pb2.Payload, restore=False):
     return model, context.get("restored"), violations
 
 
+def _concat_path(path: str, item: str) -> str:
+    # the parent path is extended in place instead of being split and joined again
+    return f"{path}.{item}" if path else item
+
+
 def recursive_recover(path: str, old_value: Any) -> Any:
-    loc = path.split('.') if path else []
     recover_value = get_dict_field(PAYLOAD_RECOVERY_SCHEMA, path)
 
     if callable(recover_value):
         return recover_value(old_value)
     elif isinstance(recover_value, dict):
-        return {k: recursive_recover(".".join(loc + [k]), None) for k in recover_value}
+        return {k: recursive_recover(_concat_path(path, k), None) for k in recover_value}
     elif isinstance(recover_value, list):
-        return [recursive_recover(".".join(loc + [str(i)]), None) for i in range(len(recover_value))]
+        return [recursive_recover(_concat_path(path, str(i)), None) for i in range(len(recover_value))]
     return recover_value
 
 
@@ -55,6 +55,9 @@ class RecoverResult:
         print(f"{prefix} : {path_string} : value : {truncate(old_value)} -> {truncate(new_value)}")
 
 
+_MISSING = object()
+
+
 class Recover:
     def __init__(self):
         self.recover_funcs = {}
@@ -73,16 +76,19 @@ class Recover:
         # _path = violation.path.split('.')
         _path = cls.split_path(violation.path)
         for p in _path:
-            if hasattr(_value, p):
-                _value = getattr(_value, p)
+            # single lookup instead of hasattr() + getattr(), missing parts are skipped as before
+            _next = getattr(_value, p, _MISSING)
+            if _next is not _MISSING:
+                _value = _next
 
         return deepcopy(_value)
 
     def recover_one(self, payload, violation):
 
-        if violation.path in self.recover_funcs:
+        recover_func = self.recover_funcs.get(violation.path)
+        if recover_func is not None:
             old_value = self.get_value_by_violation(payload, violation)
-            self.recover_funcs[violation.path](payload)
+            recover_func(payload)
             new_value = self.get_value_by_violation(payload, violation)
             return RecoverResult(True, violation.path, old_value, new_value)
 
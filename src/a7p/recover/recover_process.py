@@ -45,7 +45,7 @@ def attempt_to_recover(validation_error: A7PValidationError):
             logger.info("Final validation")
             validate(err.payload, fail_fast=False)
         except exceptions.A7PValidationError as err:
-            for v in err.all_violations:
+            for v in err.iter_violations():
                 color_print(v.format(), levelname="WARNING")
             logger.warning("Violations still found")
             logger.error("Can't recover the payload")
@@ -13,7 +13,7 @@ It includes the following components:
    This subclass of `SpecValidator` automatically registers a predefined set of validation functions for the most common payload fields. It is used to simplify the validation process by providing out-of-the-box validation logic for a variety of fields.
 
 4. **validate_spec Function**:
-   The `validate_spec` function is the main entry point for validating a payload. It converts a protobuf message into a dictionary, then uses `_DefaultSpecValidator` to validate the data. If the data is invalid, an `A7PSpecValidationError` is raised, which includes details about the violations.
+   The `validate_spec` function is the main entry point for validating a payload. It converts the profile message into a dictionary field by field, then validates it with the default validation functions, precompiled once at import into a flat per-field plan. If the data is invalid, an `A7PSpecValidationError` is raised, which includes details about the violations.
 
 Key Features:
 - **Flexible Validation**: The validation functions are designed to be flexible, allowing for different kinds of validation checks, such as length checks, range checks, and type checks.
@@ -31,12 +31,12 @@ Module Dependencies:
 
 """
 
+import sys
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Callable, Any, Tuple, Type, Dict, Optional, Union, List
+from typing import Callable, Any, Tuple, Type, Dict, Optional, Union, List, NamedTuple
 
-import a7p
 from . import profedit_pb2
 from .exceptions import SpecViolation, A7PSpecTypeError, A7PSpecValidationError
 
@@ -47,6 +47,9 @@ SpecValidationResult = Tuple[bool, Union[str, List['SpecViolation']]]
 SpecValidatorFunction = Callable[[Any, Path, List[Any]], SpecValidationResult]
 SpecFlexibleValidatorFunction = Callable[..., SpecValidationResult]
 
+# marks a missing entry in lookups where None is a valid value
+_MISSING = object()
+
 
 @dataclass
 class SpecCriterion:
@@ -60,6 +63,9 @@ class SpecCriterion:
     Methods:
         validate(data, path, violations): Validates the data against the validation function and tracks violations.
     """
+    # declared by hand, dataclass(slots=True) needs Python 3.10
+    __slots__ = ('path', 'validation_func')
+
     path: Path
     validation_func: SpecFlexibleValidatorFunction
 
@@ -101,16 +107,16 @@ def assert_spec_type(*expected_types: Type) -> Callable[[SpecFlexibleValidatorFu
     if not all(isinstance(t, type) for t in expected_types):
         raise ValueError("all expected_types must be valid types.")
 
+    # built once per decorated function instead of on every call
+    types_ = tuple(expected_types)
+    # values of exactly the expected types skip the isinstance() subclass check
+    exact_types = frozenset(types_)
+
     def decorator(func: SpecFlexibleValidatorFunction) -> SpecFlexibleValidatorFunction:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if args:
-                first_arg = args[0]
-                if not isinstance(first_arg, tuple(expected_types)):
-                    raise A7PSpecTypeError(
-                        tuple(expected_types),
-                        type(first_arg)
-                    )
+            if args and type(args[0]) not in exact_types and not isinstance(args[0], types_):
+                raise A7PSpecTypeError(types_, type(args[0]))
             return func(*args, **kwargs)
 
         return wrapper
@@ -118,6 +124,25 @@ def assert_spec_type(*expected_types: Type) -> Callable[[SpecFlexibleValidatorFu
     return decorator
 
 
+# The messages only depend on the limits, which are fixed for each check, so they are
+# formatted once per distinct set of limits instead of on every assertion;
+# typed, so e.g. 0 and 0.0 limits keep their own formatting; bounded, as the public
+# assert_* helpers also take limits from their callers
+@lru_cache(maxsize=128, typed=True)
+def _shorter_le_message(max_len: int) -> str:
+    return f"expected string shorter than {max_len} characters"
+
+
+@lru_cache(maxsize=128, typed=True)
+def _float_range_message(min_value: float, max_value: float, divisor: float) -> str:
+    return f"expected value in range [{(min_value * divisor):.1f}, {(max_value * divisor):.1f}]"
+
+
+@lru_cache(maxsize=128, typed=True)
+def _int_range_message(min_value: int, max_value: int) -> str:
+    return f"expected integer value in range [{min_value}, {max_value}]"
+
+
 # assertion methods section
 @assert_spec_type(str)
 def assert_shorter_le(string: str, max_len: int) -> SpecValidationResult:
@@ -132,7 +157,7 @@ def assert_shorter_le(string: str, max_len: int) -> SpecValidationResult:
         SpecValidationResult: A tuple containing a boolean indicating whether the string is shorter than max_len,
                               and an error message if not.
     """
-    return len(string) <= max_len, f"expected string shorter than {max_len} characters"
+    return len(string) <= max_len, _shorter_le_message(max_len)
 
 
 @assert_spec_type(float, int)
@@ -150,8 +175,7 @@ def assert_float_range(value: float, min_value: float, max_value: float, divisor
         SpecValidationResult: A tuple containing a boolean indicating whether the value is within the range,
                               and a message if not.
     """
-    return (min_value <= value / divisor <= max_value,
-            f"expected value in range [{(min_value * divisor):.1f}, {(max_value * divisor):.1f}]")
+    return min_value <= value / divisor <= max_value, _float_range_message(min_value, max_value, divisor)
 
 
 @assert_spec_type(int)
@@ -168,7 +192,7 @@ def assert_int_range(value: int, min_value: int, max_value: int) -> SpecValidati
         SpecValidationResult: A tuple containing a boolean indicating whether the value is within the range,
                               and a message if not.
     """
-    return min_value <= value <= max_value, f"expected integer value in range [{min_value}, {max_value}]"
+    return min_value <= value <= max_value, _int_range_message(min_value, max_value)
 
 
 def assert_choice(value: Any, keys: List[Any]) -> SpecValidationResult:
@@ -208,6 +232,17 @@ def assert_items_count(items: Union[tuple, list], min_count: int, max_count: int
     return True, ""
 
 
+def _always_valid(x: Any, *args: Any, **kwargs: Any) -> SpecValidationResult:
+    """Default root criterion that accepts any data."""
+    return True, ""
+
+
+_ROOT_CRITERION = SpecCriterion(Path("~"), _always_valid)
+
+# Maximum number of walked paths a SpecValidator keeps resolved
+_RESOLVED_MAXSIZE = 4096
+
+
 class SpecValidator:
     """
     A class responsible for validating data according to specified criteria.
@@ -233,9 +268,13 @@ class SpecValidator:
         """
         Initializes the SpecValidator with an empty criteria dictionary and a default registration.
         """
-        self.criteria: Dict[str, SpecCriterion] = {}
-        # Register a default validation that always passes
-        self.register("~", lambda x, *args, **kwargs: (True, ""))
+        # Register a default validation that always passes, shared by all instances
+        self.criteria: Dict[str, SpecCriterion] = {"~": _ROOT_CRITERION}
+        # walked path -> its criterion and Path, or None, reset by register and unregister,
+        # once it holds _RESOLVED_MAXSIZE paths, and by validate if the criteria were changed
+        # directly, compared against the copy they were resolved with
+        self._resolved: Dict[str, Optional[Tuple[SpecCriterion, Path]]] = {}
+        self._resolved_criteria: Dict[str, SpecCriterion] = {}
 
     def register(self, path: Union[Path, str], criteria: SpecFlexibleValidatorFunction):
         """
@@ -250,7 +289,9 @@ class SpecValidator:
         """
         if path in self.criteria:
             raise KeyError(f"Criterion for {path} already exists.")
-        self.criteria[str(path)] = SpecCriterion(Path(path), criteria)
+        # keys are interned once here, so lookups by equal strings can match on identity
+        self.criteria[sys.intern(str(path))] = SpecCriterion(Path(path), criteria)
+        self._resolved.clear()
 
     def unregister(self, key: str):
         """
@@ -260,6 +301,7 @@ class SpecValidator:
             key (str): The path of the criterion to remove.
         """
         self.criteria.pop(key, None)
+        self._resolved.clear()
 
     def get_criteria(self, path: Path) -> Optional[SpecCriterion]:
         """
@@ -294,145 +336,232 @@ class SpecValidator:
         if violations is None:
             violations = []
 
+        self._refresh_resolved()
+        self._validate(data, path.as_posix() if isinstance(path, Path) else path, violations)
+
+        return len(violations) == 0, violations
+
+    def _refresh_resolved(self) -> None:
+        """
+        Drops the resolved paths if the criteria were changed directly instead of
+        through register and unregister.
+        """
+        if self._resolved_criteria != self.criteria:
+            self._resolved.clear()
+            self._resolved_criteria = dict(self.criteria)
+
+    def _validate(self, data: Any, path: str, violations: List[SpecViolation]) -> None:
+        """
+        Walks the data with the path kept as a plain string, a Path is only built
+        for the nodes that have a criterion.
+
+        Parameters:
+            data (Any): The data to validate.
+            path (str): The posix form of the current path.
+            violations (List[SpecViolation]): A list to accumulate validation violations.
+        """
         # If `data` is a dictionary, recursively validate its key-value pairs
         if isinstance(data, dict):
             for key, value in data.items():
-                current_path = path / key
-                self.validate(value, current_path, violations)
+                self._validate(value, f"{path}/{key}", violations)
 
         # If `data` is a list, recursively validate its elements
         elif isinstance(data, list):
             for i, item in enumerate(data):
-                item_path = path / f"[{i}]"
-                self.validate(item, item_path, violations)
+                self._validate(item, f"{path}/[{i}]", violations)
+
+        # Validate the data at the current path according to its criterion,
+        # the lookup and the Path are resolved once per distinct path
+        resolved = self._resolved.get(path, _MISSING)
+        if resolved is _MISSING:
+            resolved = self._resolve(path)
+        if resolved is not None:
+            criterion, criterion_path = resolved
+            criterion.validate(data, criterion_path, violations)
+
+    def _resolve(self, path: str) -> Optional[Tuple[SpecCriterion, Path]]:
+        """
+        Looks up the criterion of a walked path with get_criteria and caches it
+        with the Path it is validated at.
 
-        # Validate the data at the current path according to its criterion
-        criterion = self.get_criteria(path)
-        if isinstance(criterion, SpecCriterion):
-            criterion.validate(data, path, violations)
+        Parameters:
+            path (str): The posix form of the path.
 
-        return len(violations) == 0, violations
+        Returns:
+            Optional[Tuple[SpecCriterion, Path]]: The criterion and the path, or None if there is no criterion.
+        """
+        criterion_path = Path(path)
+        criterion = self.get_criteria(criterion_path)
+        resolved = (criterion, criterion_path) if isinstance(criterion, SpecCriterion) else None
+        # the walked paths include the list indices, so the cache is bounded
+        if len(self._resolved) >= _RESOLVED_MAXSIZE:
+            self._resolved.clear()
+        self._resolved[path] = resolved
+        return resolved
+
+
+class _ScaledRange(NamedTuple):
+    """Allowed range of a profile field that is stored as an integer scaled by `divisor`."""
+    min_value: float
+    max_value: float
+    divisor: float = 1
+
+
+# Spec limits of the profile scalars, the single source for both the default checks
+# below and the generated fast pre-check
+_STR_MAX_LEN: Dict[str, int] = {
+    "profile_name": 50,
+    "cartridge_name": 50,
+    "caliber": 50,
+    "bullet_name": 50,
+    "device_uuid": 50,
+    "short_name_top": 8,
+    "short_name_bot": 8,
+    "user_note": 1024,
+}
+
+_SCALED_RANGES: Dict[str, _ScaledRange] = {
+    "zero_x": _ScaledRange(-200.0, 200.0, 1000),
+    "zero_y": _ScaledRange(-200.0, 200.0, 1000),
+    "sc_height": _ScaledRange(-5000.0, 5000.0),
+    "r_twist": _ScaledRange(0.0, 100.0, 100),
+    "c_muzzle_velocity": _ScaledRange(10.0, 3000.0, 10),
+    "c_zero_temperature": _ScaledRange(-100.0, 100.0),
+    "c_t_coeff": _ScaledRange(0.0, 5.0, 1000),
+    "c_zero_air_temperature": _ScaledRange(-100.0, 100.0),
+    "c_zero_air_pressure": _ScaledRange(300.0, 1500.0, 10),
+    "c_zero_air_humidity": _ScaledRange(0.0, 100.0),
+    "c_zero_w_pitch": _ScaledRange(-90.0, 90.0, 10),
+    "c_zero_p_temperature": _ScaledRange(-100.0, 100.0),
+    "b_diameter": _ScaledRange(0.001, 50.0, 1000),
+    "b_weight": _ScaledRange(1.0, 6553.5, 10),
+    "b_length": _ScaledRange(0.01, 200.0, 1000),
+}
 
 
 # Default validation functions section
 def _check_profile_name(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the profile name is shorter than 50 characters."""
-    return assert_shorter_le(x, 50)
+    return assert_shorter_le(x, _STR_MAX_LEN["profile_name"])
 
 
 def _check_cartridge_name(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the cartridge name is shorter than 50 characters."""
-    return assert_shorter_le(x, 50)
+    return assert_shorter_le(x, _STR_MAX_LEN["cartridge_name"])
 
 
 def _check_caliber(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the caliber name is shorter than 50 characters."""
-    return assert_shorter_le(x, 50)
+    return assert_shorter_le(x, _STR_MAX_LEN["caliber"])
 
 
 def _check_bullet_name(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the bullet name is shorter than 50 characters."""
-    return assert_shorter_le(x, 50)
+    return assert_shorter_le(x, _STR_MAX_LEN["bullet_name"])
 
 
 def _check_device_uuid(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the device UUID is shorter than 50 characters."""
-    return assert_shorter_le(x, 50)
+    return assert_shorter_le(x, _STR_MAX_LEN["device_uuid"])
 
 
 def _check_short_name_top(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the short name (top) is shorter than 8 characters."""
-    return assert_shorter_le(x, 8)
+    return assert_shorter_le(x, _STR_MAX_LEN["short_name_top"])
 
 
 def _check_short_name_bot(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the short name (bottom) is shorter than 8 characters."""
-    return assert_shorter_le(x, 8)
+    return assert_shorter_le(x, _STR_MAX_LEN["short_name_bot"])
 
 
 def _check_user_note(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the user note is shorter than 1024 characters."""
-    return assert_shorter_le(x, 1024)
+    return assert_shorter_le(x, _STR_MAX_LEN["user_note"])
 
 
 def _check_zero_x(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero x value is in the range of [-200.0, 200.0] with a divisor of 1000."""
-    return assert_float_range(x, -200.0, 200.0, 1000)
+    return assert_float_range(x, *_SCALED_RANGES["zero_x"])
 
 
 def _check_zero_y(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero y value is in the range of [-200.0, 200.0] with a divisor of 1000."""
-    return assert_float_range(x, -200.0, 200.0, 1000)
+    return assert_float_range(x, *_SCALED_RANGES["zero_y"])
 
 
 def _check_sc_height(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the SC height is in the range of [-5000.0, 5000.0]."""
-    return assert_float_range(x, -5000.0, 5000.0)
+    return assert_float_range(x, *_SCALED_RANGES["sc_height"])
 
 
 def _check_r_twist(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the right twist value is in the range of [0.0, 100.0] with a divisor of 100."""
-    return assert_float_range(x, 0.0, 100.0, 100)
+    return assert_float_range(x, *_SCALED_RANGES["r_twist"])
 
 
 def _check_c_muzzle_velocity(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the muzzle velocity is in the range of [10.0, 3000.0] with a divisor of 10."""
-    return assert_float_range(x, 10.0, 3000.0, 10)
+    return assert_float_range(x, *_SCALED_RANGES["c_muzzle_velocity"])
 
 
 def _check_c_zero_temperature(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero temperature is in the range of [-100.0, 100.0]."""
-    return assert_float_range(x, -100.0, 100.0)
+    return assert_float_range(x, *_SCALED_RANGES["c_zero_temperature"])
 
 
 def _check_c_t_coeff(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the temperature coefficient is in the range of [0.0, 5.0] with a divisor of 1000."""
-    return assert_float_range(x, 0.0, 5.0, 1000)
+    return assert_float_range(x, *_SCALED_RANGES["c_t_coeff"])
 
 
 def _check_c_zero_air_temperature(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero air temperature is in the range of [-100.0, 100.0]."""
-    return assert_float_range(x, -100.0, 100.0)
+    return assert_float_range(x, *_SCALED_RANGES["c_zero_air_temperature"])
 
 
 def _check_c_zero_air_pressure(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero air pressure is in the range of [300.0, 1500.0] with a divisor of 10."""
-    return assert_float_range(x, 300.0, 1500.0, 10)
+    return assert_float_range(x, *_SCALED_RANGES["c_zero_air_pressure"])
 
 
 def _check_c_zero_air_humidity(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero air humidity is in the range of [0.0, 100.0]."""
-    return assert_float_range(x, 0.0, 100.0)
+    return assert_float_range(x, *_SCALED_RANGES["c_zero_air_humidity"])
 
 
 def _check_c_zero_w_pitch(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero wind pitch is in the range of [-90.0, 90.0] with a divisor of 10."""
-    return assert_float_range(x, -90.0, 90.0, 10)
+    return assert_float_range(x, *_SCALED_RANGES["c_zero_w_pitch"])
 
 
 def _check_c_zero_p_temperature(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero pressure temperature is in the range of [-100.0, 100.0]."""
-    return assert_float_range(x, -100.0, 100.0)
+    return assert_float_range(x, *_SCALED_RANGES["c_zero_p_temperature"])
 
 
 def _check_b_diameter(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero ballistic diameter is in the range of [0.001, 50.0] with a divisor of 1000."""
-    return assert_float_range(x, 0.001, 50.0, 1000)
+    return assert_float_range(x, *_SCALED_RANGES["b_diameter"])
 
 
 def _check_b_weight(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero ballistic weight is in the range of [1.0, 6553.5] with a divisor of 10."""
-    return assert_float_range(x, 1.0, 6553.5, 10)
+    return assert_float_range(x, *_SCALED_RANGES["b_weight"])
 
 
 def _check_b_length(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the zero ballistic length is in the range of [0.01, 200.0] with a divisor of 1000."""
-    return assert_float_range(x, 0.01, 200.0, 1000)
+    return assert_float_range(x, *_SCALED_RANGES["b_length"])
+
+
+# Choices are kept as lists because assert_choice reports them in its message
+_TWIST_DIR_CHOICES = ['RIGHT', 'LEFT']
 
 
 def _check_twist_dir(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the twist direction is either 'RIGHT' or 'LEFT'."""
-    return assert_choice(x, ['RIGHT', 'LEFT'])
+    return assert_choice(x, _TWIST_DIR_CHOICES)
 
 
 # Validation functions for distances/c_zero_distance_idx section
@@ -446,7 +575,17 @@ def _check_one_distance(x: float, *args: Any, **kwargs: Any) -> SpecValidationRe
     return assert_float_range(x, 1.0, 3000.0, 100)
 
 
+# `_check_one_distance` bounds pre-scaled to the integer values stored in the payload
+_MIN_DISTANCE = int(1.0 * 100)
+_MAX_DISTANCE = int(3000.0 * 100)
+
+
 # Validation functions for switches section
+_DISTANCE_FROM_CHOICES = frozenset(("value", "index"))
+# the names as the payload dictionary spells them, matched before falling back to lower()
+_DISTANCE_FROM_NAMES = frozenset(("VALUE", "INDEX"))
+
+
 def _check_distance_from(x: Union[float, int, str], *args: Any, **kwargs: Any) -> SpecValidationResult:
     """
     Validates that the distance value is within the range [1.0, 3000.0] (divisor of 100),
@@ -454,7 +593,7 @@ def _check_distance_from(x: Union[float, int, str], *args: Any, **kwargs: Any) -
     """
     if isinstance(x, (float, int)):
         return assert_float_range(x, 1.0, 3000.0, 100)
-    if isinstance(x, str) and x.lower() in ["value", "index"]:  # TODO: check special value
+    if isinstance(x, str) and (x in _DISTANCE_FROM_NAMES or x.lower() in _DISTANCE_FROM_CHOICES):  # TODO: check special value
         return True, ""
     return False, "unexpected value or value type"
 
@@ -466,8 +605,15 @@ def _check_c_idx(idx: int, *args: Any, **kwargs: Any) -> SpecValidationResult:
     return assert_int_range(idx, 0, 200)
 
 
+_RETICLE_IDX_REASON = "expected integer value in range [0, 255]"
+
+
 def _check_reticle_idx(x: int, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the reticle index is in the range of [0, 255]."""
+    # a byte-sized value has no bits set above 0xFF, negatives included,
+    # so a single mask replaces both bound comparisons
+    if type(x) is int and not x & ~0xFF:
+        return True, _RETICLE_IDX_REASON
     return assert_int_range(x, 0, 255)
 
 
@@ -476,33 +622,54 @@ def _check_zoom(x: int, *args: Any, **kwargs: Any) -> SpecValidationResult:
     return assert_int_range(x, 0, 6)
 
 
+_switch_criteria: Dict[str, SpecCriterion] = {
+    "c_idx": SpecCriterion(Path("c_idx"), _check_c_idx),
+    "reticle_idx": SpecCriterion(Path("reticle_idx"), _check_reticle_idx),
+    "zoom": SpecCriterion(Path("zoom"), _check_zoom),
+    "distance_from": SpecCriterion(Path("distance_from"), _check_distance_from),
+}
+
+
+def _check_switches_count(x: int, *args: Any, **kwargs: Any) -> SpecValidationResult:
+    """Validates that there are at least 4 switches."""
+    return x >= 4, f"expected minimum 4 items but got {x}"
+
+
+_switches_count_criterion = SpecCriterion(Path("~/profile/switches"), _check_switches_count)
+
+
 def _check_switches(switches: List[dict], path: Path, violations: List[SpecViolation], *args: Any,
                     **kwargs: Any) -> SpecValidationResult:
     """
     Validates the switches list, ensuring it contains at least 4 items, and validates each switch
     based on specific criteria (c_idx, reticle_idx, zoom, distance_from).
     """
-    criterion = SpecCriterion(
-        path,
-        lambda x, *args, **kwargs: (x >= 4, f"expected minimum 4 items but got {x}")
-    )
-    criterion.validate(len(switches), path, violations)
+    _switches_count_criterion.validate(len(switches), path, violations)
+
+    # switches share one fixed shape, so each item is checked directly against the
+    # per-key criteria instead of re-entering the generic recursive walker;
+    # the lookup is bound to a local once for the whole loop
+    get_criterion = _switch_criteria.get
+    for i, switch in enumerate(switches):
+        switch_path = path / f"[{i}]"
+        for key, value in switch.items():
+            criterion = get_criterion(key)
+            if criterion is not None:
+                criterion.validate(value, switch_path / key, violations)
 
-    v = SpecValidator()
-    v.register("c_idx", _check_c_idx)
-    v.register("reticle_idx", _check_reticle_idx)
-    v.register("zoom", _check_zoom)
-    v.register("distance_from", _check_distance_from)
+    return True, "No reasons"
 
-    v.validate(switches, path, violations)
 
-    return True, "No reasons"
+_switches_criterion = SpecCriterion(Path("~/profile/switches"), _check_switches)
 
 
 # Validation functions for bc type and bc/cd/mv values section
+_BC_TYPE_CHOICES = ['G7', 'G1', 'CUSTOM']
+
+
 def _check_bc_type(x: str, *args: Any, **kwargs: Any) -> SpecValidationResult:
     """Validates that the ballistic coefficient type is one of 'G7', 'G1', or 'CUSTOM'."""
-    return assert_choice(x, ['G7', 'G1', 'CUSTOM'])
+    return assert_choice(x, _BC_TYPE_CHOICES)
 
 
 def _check_bc_value(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult:
@@ -525,6 +692,71 @@ def _check_mv_value(x: float, *args: Any, **kwargs: Any) -> SpecValidationResult
     return assert_float_range(x, 0.0, 3000.0, 10)
 
 
+def _check_std_coef_rows_count(x: list, *args: Any, **kwargs: Any) -> SpecValidationResult:
+    """Validates that there are 1 to 5 coefficient rows for the G1 and G7 bc types."""
+    return assert_items_count(x, 1, 5)
+
+
+def _check_custom_coef_rows_count(x: list, *args: Any, **kwargs: Any) -> SpecValidationResult:
+    """Validates that there are 1 to 200 coefficient rows for the CUSTOM bc type."""
+    return assert_items_count(x, 1, 200)
+
+
+def _coef_rows_validator(check_count: SpecFlexibleValidatorFunction, check_bc_cd: SpecFlexibleValidatorFunction,
+                         check_mv: SpecFlexibleValidatorFunction) -> SpecValidator:
+    """Builds a validator for the 'coef_rows' items of a single bc_type family."""
+    v = SpecValidator()
+    v.register("coef_rows", check_count)
+    v.register("bc_cd", check_bc_cd)
+    v.register("mv", check_mv)
+    return v
+
+
+# coef_rows validators are stateless, so they are built once and shared between calls
+_bc_type_criterion = SpecCriterion(Path("bc_type"), _check_bc_type)
+_coef_rows_std_validator = _coef_rows_validator(_check_std_coef_rows_count, _check_bc_value, _check_mv_value)
+_coef_rows_custom_validator = _coef_rows_validator(_check_custom_coef_rows_count, _check_cd_value, _check_ma_value)
+
+# bc_type -> coef_rows validator dispatch table
+_coef_rows_validators: Dict[str, SpecValidator] = {
+    'G7': _coef_rows_std_validator,
+    'G1': _coef_rows_std_validator,
+    'CUSTOM': _coef_rows_custom_validator,
+}
+
+
+def _validate_coef_rows(validator: SpecValidator, coef_rows: Any, coef_rows_path: Path,
+                        violations: List[SpecViolation]) -> None:
+    """
+    Validates the coef_rows with the validator of their bc_type, row by row, in the order
+    the validator walks them: the rows first, the rows count last.
+
+    Once more than 12 violations are collected only the summary violation is reported,
+    so the remaining rows are not checked.
+
+    Args:
+        validator (SpecValidator): The coef_rows validator matching the bc_type.
+        coef_rows (Any): The coef_rows to validate.
+        coef_rows_path (Path): The path to the coef_rows for error reporting.
+        violations (list): A list to store the violations found during validation.
+    """
+    if not isinstance(coef_rows, list):
+        validator.validate(coef_rows, coef_rows_path, violations)
+        return
+
+    # the rows are walked with the validator's internal walk, so its criteria are checked once
+    validator._refresh_resolved()
+    rows_path = coef_rows_path.as_posix()
+    for i, row in enumerate(coef_rows):
+        validator._validate(row, f"{rows_path}/[{i}]", violations)
+        if len(violations) > 12:
+            return
+
+    count_criterion = validator.get_criteria(coef_rows_path)
+    if count_criterion is not None:
+        count_criterion.validate(coef_rows, coef_rows_path, violations)
+
+
 # Validation function for coef_rows
 def _check_coef_rows(profile: dict, path: Path, violations: List[SpecViolation], *args: Any, **kwargs: Any) -> Tuple[
     bool, str]:
@@ -543,24 +775,20 @@ def _check_coef_rows(profile: dict, path: Path, violations: List[SpecViolation],
                            and the second element is a reason or message.
     """
     bc_type = profile['bc_type']
-    bc_criterion = SpecCriterion(Path("bc_type"), _check_bc_type)
     coef_rows_violations = []
 
     # Validate the boundary condition type
-    is_valid, reason = bc_criterion.validate(bc_type, path, coef_rows_violations)
+    is_valid, reason = _bc_type_criterion.validate(bc_type, path, coef_rows_violations)
 
     if is_valid:
-        v = SpecValidator()
-
-        # Register validation rules based on bc_type
-        if bc_type in ['G7', 'G1']:
-            v.register("coef_rows", lambda x, *args, **kwargs: assert_items_count(x, 1, 5))
-            v.register("bc_cd", _check_bc_value)
-            v.register("mv", _check_mv_value)
-        elif bc_type == 'CUSTOM':
-            v.register("coef_rows", lambda x, *args, **kwargs: assert_items_count(x, 1, 200))
-            v.register("bc_cd", _check_cd_value)
-            v.register("mv", _check_ma_value)
+        # Perform the validation with the rules matching bc_type
+        # only the coef_rows subtree is walked, the rest of the profile is already
+        # covered by the default validator
+        coef_rows_validator = _coef_rows_validators.get(bc_type)
+        if coef_rows_validator is not None:
+            coef_rows = profile['coef_rows']
+            if not _coef_rows_fast_checks[bc_type](coef_rows):
+                _validate_coef_rows(coef_rows_validator, coef_rows, path / "coef_rows", coef_rows_violations)
         else:
             coef_rows_violations.append(
                 SpecViolation(
@@ -570,22 +798,32 @@ def _check_coef_rows(profile: dict, path: Path, violations: List[SpecViolation],
                 )
             )
 
-        # Perform the validation
-        v.validate(profile, path, coef_rows_violations)
-
     # Handle violations
     if len(coef_rows_violations) <= 12:
         violations.extend(coef_rows_violations)
     else:
+        coef_rows_path = path / "coef_rows"
         violations.append(SpecViolation(
-            path / "coef_rows",
-            f"Too many errors in {path / 'coef_rows'}",
+            coef_rows_path,
+            f"Too many errors in {coef_rows_path}",
             "More than 12 errors found, listing all is omitted"
         ))
 
     return True, ""
 
 
+def _check_distances_count(x: list, *args: Any, **kwargs: Any) -> SpecValidationResult:
+    """Validates that there are 1 to 200 distances."""
+    return assert_items_count(x, 1, 200)
+
+
+# The criteria don't depend on the validated data, so they are built once at import;
+# violations take their path from the `validate` call, not from the criterion
+_zero_distance_idx_criterion = SpecCriterion(Path("~/profile/c_zero_distance_idx"), _check_c_zero_distance_idx)
+_distances_count_criterion = SpecCriterion(Path("~/profile/distances"), _check_distances_count)
+_one_distance_criterion = SpecCriterion(Path("~/profile/[:] "), _check_one_distance)
+
+
 # Validation function for distances
 def _check_distances(profile: dict, path: Path, violations: List[SpecViolation], *args: Any, **kwargs: Any) -> Tuple[
     bool, str]:
@@ -603,43 +841,42 @@ def _check_distances(profile: dict, path: Path, violations: List[SpecViolation],
                            and the second element is a reason or message.
     """
     distances_violations = []
+    distances_path = path / "distances"
+    zero_idx_path = path / "c_zero_distance_idx"
 
     idx = profile["c_zero_distance_idx"]
     distances = profile["distances"]
 
-    SpecCriterion(
-        path / "c_zero_distance_idx",
-        _check_c_zero_distance_idx
-    ).validate(
-        idx,
-        path / "c_zero_distance_idx",
-        distances_violations
-    )
+    _zero_distance_idx_criterion.validate(idx, zero_idx_path, distances_violations)
 
     is_valid, reason = _check_dependency_distances(idx, distances)
     if not is_valid:
         distances_violations.append(SpecViolation("Distances", "Distance dependency error", reason))
 
-    SpecCriterion(
-        path / "distances",
-        lambda x, *args, **kwargs: assert_items_count(x, 1, 200)
-    ).validate(distances, path / "distances", distances_violations)
+    _distances_count_criterion.validate(distances, distances_path, distances_violations)
 
-    criterion = SpecCriterion(
-        path / "[:] ",
-        _check_one_distance
-    )
+    criterion = _one_distance_criterion
+    # more violations than this are replaced by a single summary violation
+    max_reported = 11
 
+    # distances is a homogeneous list of integers, so the common case is checked inline
+    # against local bounds and the full criterion only runs for the items that have to be reported
+    min_distance, max_distance = _MIN_DISTANCE, _MAX_DISTANCE
     for i, d in enumerate(distances):
-        criterion.validate(d, path / 'distances' / f"[{i}]", distances_violations)
+        if type(d) is int and min_distance <= d <= max_distance:
+            continue
+        criterion.validate(d, distances_path / f"[{i}]", distances_violations)
+        # once only the summary can be reported, the remaining items are not checked
+        if len(distances_violations) > max_reported:
+            break
 
     # Handle violations
-    if len(distances_violations) <= 11:
+    if len(distances_violations) <= max_reported:
         violations.extend(distances_violations)
     else:
         violations.append(SpecViolation(
-            path / "distances",
-            f"Too many errors in {path / 'distances'}",
+            distances_path,
+            f"Too many errors in {distances_path}",
             "More than 10 errors found, listing all is omitted"
         ))
 
@@ -674,10 +911,10 @@ def _check_profile(profile: dict, path: Path, violations: List[SpecViolation], *
     Returns:
         Tuple[bool, str]: A tuple indicating if validation passed, and a reason or message.
     """
-    v = SpecValidator()
-    v.register("~/profile/switches", _check_switches)
-
-    v.validate(profile, path, violations)
+    # switches are the only criterion below the profile level, so they are checked
+    # directly instead of walking every node of the profile dictionary
+    switches_path = path / "switches"
+    _switches_criterion.validate(profile["switches"], switches_path, violations)
 
     _check_distances(profile, path, violations, *args, **kwargs)
     _check_coef_rows(profile, path, violations, *args, **kwargs)
@@ -729,25 +966,407 @@ class _DefaultSpecValidator(SpecValidator):
 
 _default_validator = _DefaultSpecValidator()
 
+_PROFILE_PATH = Path("~/profile")
+
+
+def _compile_profile_plan(funcs: Dict[str, SpecValidationFunction]) -> Dict[str, Tuple[Path, SpecCriterion]]:
+    """
+    Flattens the default validation functions into a lookup of profile field name
+    to its precomputed path and criterion.
+
+    Args:
+        funcs (Dict[str, SpecValidationFunction]): Validation functions keyed by field name or full path.
+
+    Returns:
+        Dict[str, Tuple[Path, SpecCriterion]]: Criteria for the scalar fields of the profile.
+    """
+    plan = {}
+    for key, func in funcs.items():
+        # full-path keys such as '~/profile' are not profile fields
+        if '/' in key:
+            continue
+        path = _PROFILE_PATH / key
+        plan[sys.intern(key)] = (path, SpecCriterion(path, func))
+    return plan
+
+
+# the default spec only has criteria for the profile fields and the profile itself,
+# so validate_spec checks them straight from this plan instead of walking the whole dict
+_profile_plan = _compile_profile_plan(_default_validation_funcs)
+_profile_criterion = SpecCriterion(_PROFILE_PATH, _default_validation_funcs["~/profile"])
+
+
+class _IntBound(NamedTuple):
+    """Inclusive bounds of an int32 profile field."""
+    field: str
+    min_value: int
+    max_value: int
+
+
+class _StrLimit(NamedTuple):
+    """Maximum length of a string profile field."""
+    field: str
+    max_len: int
+
+
+# Integer bounds equivalent to the scaled float ranges of the default checks above,
+# applied to the raw int32 values stored in the profile
+_FAST_INT_BOUNDS: Tuple[_IntBound, ...] = tuple(
+    _IntBound(field, round(r.min_value * r.divisor), round(r.max_value * r.divisor))
+    for field, r in _SCALED_RANGES.items()
+)
+
+_FAST_STR_LIMITS: Tuple[_StrLimit, ...] = tuple(
+    _StrLimit(field, max_len) for field, max_len in _STR_MAX_LEN.items()
+)
+
+
+def _emit_out_of_range(expr: str, min_value: int, max_value: int) -> str:
+    """
+    Returns the source of a test that is true when the integer `expr` is outside [min_value, max_value].
+
+    Args:
+        expr (str): Source of the integer expression to test.
+        min_value (int): The minimum allowed value.
+        max_value (int): The maximum allowed value.
+
+    Returns:
+        str: A Python expression.
+    """
+    # [0, 2**n - 1] ranges, such as byte-sized fields, reduce to a single mask test
+    if min_value == 0 and max_value & (max_value + 1) == 0:
+        return f"{expr} & ~{max_value:#x}"
+    return f"not {min_value} <= {expr} <= {max_value}"
+
+
+# Integer bounds of the switch fields that are a plain range, `c_idx` and `distance_from`
+# also accept special values and are emitted separately
+_FAST_SWITCH_BOUNDS: Tuple[_IntBound, ...] = (
+    _IntBound("reticle_idx", 0, 255),
+    _IntBound("zoom", 0, 6),
+)
+
+# enum numbers accepted by the default checks
+_FAST_TWIST_DIRS = (profedit_pb2.RIGHT, profedit_pb2.LEFT)
+_FAST_STD_BC_TYPES = (profedit_pb2.G1, profedit_pb2.G7)
+_FAST_DTYPES = (profedit_pb2.VALUE, profedit_pb2.INDEX)
+
+_FAST_CHECK_DOC = """
+    Checks the profile message directly against the default spec rules.
+
+    This is a conservative pre-check: it returns True only when the full validator
+    would report no violations, and False whenever anything might be wrong,
+    leaving the detailed report to the dict-based validation.
+
+    Args:
+        profile (profedit_pb2.Profile): The profile message to check.
+
+    Returns:
+        bool: True if the profile satisfies every default spec rule.
+    """
+
+
+def _compile_profile_check(str_limits: Tuple[_StrLimit, ...],
+                           int_bounds: Tuple[_IntBound, ...],
+                           switch_bounds: Tuple[_IntBound, ...]) -> Callable[[profedit_pb2.Profile], bool]:
+    """
+    Generates a single straight-line function that checks a profile message against the given tables.
+
+    Args:
+        str_limits (Tuple[_StrLimit, ...]): Maximum lengths of the string fields.
+        int_bounds (Tuple[_IntBound, ...]): Inclusive bounds of the integer fields.
+        switch_bounds (Tuple[_IntBound, ...]): Inclusive bounds of the integer fields of each switch.
+
+    Returns:
+        Callable[[profedit_pb2.Profile], bool]: A function returning True if the profile is within the spec.
 
-def validate_spec(payload: profedit_pb2.Payload) -> None:
+    Raises:
+        ValueError: If a field name is not a valid identifier.
+    """
+    for entry in str_limits + int_bounds + switch_bounds:
+        if not entry.field.isidentifier():
+            raise ValueError(f"invalid field name {entry.field!r}")
+
+    # Order matters only for speed: the repeated fields are the usual source of spec
+    # violations, so they are checked before the scalars and broken profiles exit early
+    lines = [
+        "def _is_valid_profile_fast(profile):",
+        "    coef_rows = profile.coef_rows",
+        "    bc_type = profile.bc_type",
+        "    if bc_type in _FAST_STD_BC_TYPES:",
+        "        max_rows, max_mv = 5, 30000",
+        "    elif bc_type == CUSTOM:",
+        "        max_rows, max_mv = 200, 100000",
+        "    else:",
+        "        return False",
+        "    if not 1 <= len(coef_rows) <= max_rows:",
+        "        return False",
+        "    bc_cd = [row.bc_cd for row in coef_rows]",
+        "    mv = [row.mv for row in coef_rows]",
+        "    if min(bc_cd) < 0 or max(bc_cd) > 100000 or min(mv) < 0 or max(mv) > max_mv:",
+        "        return False",
+        "    distances = profile.distances",
+        "    if not 1 <= len(distances) <= 200:",
+        "        return False",
+        "    zero_idx = profile.c_zero_distance_idx",
+        "    if not 0 <= zero_idx <= 200 or zero_idx >= len(distances):",
+        "        return False",
+        # bulk range checks: min() and max() scan the repeated container in C
+        f"    if min(distances) < {_MIN_DISTANCE} or max(distances) > {_MAX_DISTANCE}:",
+        "        return False",
+        "    switches = profile.switches",
+        "    if len(switches) < 4:",
+        "        return False",
+        "    for switch in switches:",
+        "        c_idx = switch.c_idx",
+        "        if not (0 <= c_idx <= 200 or c_idx == 255):",
+        "            return False",
+    ]
+    for bound in switch_bounds:
+        lines.append(f"        if {_emit_out_of_range(f'switch.{bound.field}', bound.min_value, bound.max_value)}:")
+        lines.append("            return False")
+    lines += [
+        "        distance_from = switch.distance_from",
+        f"        if distance_from not in _FAST_DTYPES and not {_MIN_DISTANCE} <= distance_from <= {_MAX_DISTANCE}:",
+        "            return False",
+    ]
+    for limit in str_limits:
+        lines.append(f"    if len(profile.{limit.field}) > {limit.max_len}:")
+        lines.append("        return False")
+    for bound in int_bounds:
+        lines.append(f"    if {_emit_out_of_range(f'profile.{bound.field}', bound.min_value, bound.max_value)}:")
+        lines.append("        return False")
+    lines += [
+        "    if profile.twist_dir not in _FAST_TWIST_DIRS:",
+        "        return False",
+        "    return True",
+    ]
+
+    namespace: Dict[str, Any] = {
+        "_FAST_STD_BC_TYPES": _FAST_STD_BC_TYPES,
+        "_FAST_TWIST_DIRS": _FAST_TWIST_DIRS,
+        "_FAST_DTYPES": _FAST_DTYPES,
+        "CUSTOM": profedit_pb2.CUSTOM,
+    }
+    exec(compile("\n".join(lines), "<a7p spec profile check>", "exec"), namespace)
+    func = namespace["_is_valid_profile_fast"]
+    func.__doc__ = _FAST_CHECK_DOC
+    return func
+
+
+# one generated function checks the whole profile with plain attribute loads and compares,
+# without a call per field
+_is_valid_profile_fast = _compile_profile_check(_FAST_STR_LIMITS, _FAST_INT_BOUNDS, _FAST_SWITCH_BOUNDS)
+
+
+def _compile_coef_rows_check(max_rows: int, max_bc_cd: int, max_mv: int) -> Callable[[Any], bool]:
+    """
+    Generates a function that checks the 'coef_rows' list of one bc_type family in a single pass.
+
+    Like the profile pre-check it is conservative: it returns True only when the
+    coef_rows validator of the family would report no violations, anything unexpected
+    returns False and is left to the validator.
+
+    Args:
+        max_rows (int): The maximum number of rows.
+        max_bc_cd (int): The maximum stored 'bc_cd' value.
+        max_mv (int): The maximum stored 'mv' value.
+
+    Returns:
+        Callable[[Any], bool]: A function returning True if the rows are within the spec.
+    """
+    lines = [
+        "def _is_valid_coef_rows(rows):",
+        f"    if type(rows) is not list or not 1 <= len(rows) <= {max_rows}:",
+        "        return False",
+        "    for row in rows:",
+        # rows with other keys may hold nested values the validator would walk into
+        "        if type(row) is not dict or len(row) != 2:",
+        "            return False",
+        "        bc_cd = row.get('bc_cd')",
+        "        mv = row.get('mv')",
+        f"        if type(bc_cd) is not int or {_emit_out_of_range('bc_cd', 0, max_bc_cd)}:",
+        "            return False",
+        f"        if type(mv) is not int or {_emit_out_of_range('mv', 0, max_mv)}:",
+        "            return False",
+        "    return True",
+    ]
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<a7p spec coef_rows check>", "exec"), namespace)
+    return namespace["_is_valid_coef_rows"]
+
+
+# bc_type -> generated coef_rows check, rows that pass it are not walked by the validator
+_coef_rows_fast_checks: Dict[str, Callable[[Any], bool]] = {
+    'G7': _compile_coef_rows_check(5, 100000, 30000),
+    'G1': _compile_coef_rows_check(5, 100000, 30000),
+    'CUSTOM': _compile_coef_rows_check(200, 100000, 100000),
+}
+
+
+class _ProtoDictView:
+    """
+    Read-only mapping over a protobuf message that converts each field the way `a7p.to_dict` does,
+    only when it is accessed.
+
+    Keys are iterated in the same order as in `a7p.to_dict`: fields that are set first,
+    then the remaining fields with default values.
+    """
+    __slots__ = ("_msg", "_cache")
+
+    def __init__(self, msg: Any):
+        self._msg = msg
+        self._cache: Dict[str, Any] = {}
+
+    def __iter__(self):
+        msg = self._msg
+        listed = set()
+        for field, _ in msg.ListFields():
+            listed.add(field.name)
+            yield field.name
+        for field in msg.DESCRIPTOR.fields:
+            # unset singular messages and oneof members are omitted, like in MessageToDict
+            if field.name in listed or field.containing_oneof or (
+                    field.label != field.LABEL_REPEATED and field.cpp_type == field.CPPTYPE_MESSAGE):
+                continue
+            yield field.name
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        field = self._msg.DESCRIPTOR.fields_by_name[key]
+        value = getattr(self._msg, key)
+        if field.label == field.LABEL_REPEATED:
+            value = [_proto_value_to_dict(field, item) for item in value]
+        else:
+            value = _proto_value_to_dict(field, value)
+        self._cache[key] = value
+        return value
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Builds a plain dictionary with all fields, reusing the values converted so far.
+
+        Returns:
+            Dict[str, Any]: The same dictionary `a7p.to_dict` would produce for the message.
+        """
+        return _message_to_dict(self._msg, self._cache)
+
+
+@lru_cache(maxsize=None)
+def _message_defaults(descriptor: Any) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Lists the fields `a7p.to_dict` fills in when they are not set, with their converted defaults.
+
+    Args:
+        descriptor (Descriptor): The message descriptor.
+
+    Returns:
+        Tuple[Tuple[str, Any], ...]: Field names and default values in descriptor order,
+            repeated fields have `None` as a placeholder for a new empty list.
+    """
+    defaults = []
+    for field in descriptor.fields:
+        # unset singular messages and oneof members are omitted, like in MessageToDict
+        if field.containing_oneof:
+            continue
+        if field.label == field.LABEL_REPEATED:
+            defaults.append((sys.intern(field.name), None))
+        elif field.cpp_type != field.CPPTYPE_MESSAGE:
+            defaults.append((sys.intern(field.name), _proto_value_to_dict(field, field.default_value)))
+    return tuple(defaults)
+
+
+def _message_to_dict(msg: Any, converted: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Converts a protobuf message to the same dictionary `a7p.to_dict` produces, without
+    going through the generic JSON formatter.
+
+    Args:
+        msg (Message): The message to convert.
+        converted (Optional[Dict[str, Any]]): Field values that are already converted.
+
+    Returns:
+        Dict[str, Any]: The message as a dictionary, including default values.
+    """
+    result = {}
+    for field, value in msg.ListFields():
+        name = field.name
+        # a single lookup per field, values that are not cached come back as the sentinel
+        cached = converted.get(name, _MISSING) if converted else _MISSING
+        if cached is not _MISSING:
+            result[name] = cached
+        elif field.label == field.LABEL_REPEATED:
+            result[name] = [_proto_value_to_dict(field, item) for item in value]
+        else:
+            result[name] = _proto_value_to_dict(field, value)
+    for name, default in _message_defaults(msg.DESCRIPTOR):
+        if name not in result:
+            result[name] = [] if default is None else default
+    return result
+
+
+def _proto_value_to_dict(field: Any, value: Any) -> Any:
+    """
+    Converts a single protobuf field value as `a7p.to_dict` would.
+
+    Args:
+        field (FieldDescriptor): The descriptor of the field holding the value.
+        value (Any): The field value, or one item of a repeated field.
+
+    Returns:
+        Any: The converted value.
+    """
+    if field.cpp_type == field.CPPTYPE_ENUM:
+        enum_value = field.enum_type.values_by_number.get(value)
+        return value if enum_value is None else enum_value.name
+    if field.cpp_type == field.CPPTYPE_MESSAGE:
+        return _message_to_dict(value)
+    if field.cpp_type in (field.CPPTYPE_INT64, field.CPPTYPE_UINT64):
+        return str(value)
+    return value
+
+
+def validate_spec(payload: profedit_pb2.Payload, fail_fast: bool = False) -> None:
     """
     Validates a given payload using the default validator.
 
     Args:
         payload (profedit_pb2.Payload): The payload to validate.
+        fail_fast (bool): Flag indicating whether to stop checking at the first field that has violations.
+            The error carries every violation collected up to that point. Default is False.
 
     Raises:
         A7PSpecValidationError: If validation fails, raises an exception with details.
     """
-    # Convert protobuf message to dictionary, including default values
-    data = a7p.to_dict(payload)
-
-    # Perform validation
-    is_valid, violations = _default_validator.validate(data)
+    # Most payloads are valid, so check the message directly first and only build
+    # the dictionary when violations have to be located and reported
+    if not payload.HasField("profile") or _is_valid_profile_fast(payload.profile):
+        return
+
+    violations = []
+
+    # Fields are read straight from the message and converted one by one, so a fail_fast
+    # failure on a scalar is reported without converting the rest of the payload
+    profile = _ProtoDictView(payload.profile)
+    for key in profile:
+        entry = _profile_plan.get(key)
+        if entry is not None:
+            entry[1].validate(profile[key], entry[0], violations)
+            if fail_fast and violations:
+                raise A7PSpecValidationError("Spec Validation Error", payload, violations)
+
+    # Perform validation of the nested fields, they read only the repeated fields
+    # and their dependencies from the view, so no profile dictionary is built
+    _profile_criterion.validate(profile, _PROFILE_PATH, violations)
 
     # Raise an error if validation fails
-    if not is_valid:
+    if violations:
         raise A7PSpecValidationError("Spec Validation Error", payload, violations)
 
 
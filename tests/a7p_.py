@@ -1,7 +1,17 @@
+import copy
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 from a7p import *
-from a7p.exceptions import A7PError
+from a7p import protovalidate
+from a7p.a7p import _VALID_CACHE_MAXSIZE, _valid_cache, _is_known_valid, _remember_valid
+from a7p.exceptions import A7PError, A7PValidationError, A7PSpecValidationError
+from a7p.spec_validator import validate_spec
+
+TESTS_DIR = Path(__file__).parent
 
 
 class TestA7P(TestCase):
@@ -44,3 +54,104 @@ class TestA7P(TestCase):
             is_raise_exception = True
         self.assertTrue(is_raise_exception, "A7PDataError exception didn't raised")
 
+
+class TestValidateMany(TestCase):
+
+    def setUp(self) -> None:
+        with open(TESTS_DIR / "test.a7p", 'rb') as fp:
+            self.valid = load(fp, validate_=False)
+        with open(TESTS_DIR / "broken.a7p", 'rb') as fp:
+            self.broken = load(fp, validate_=False)
+
+    def testErrorsInInputOrder(self):
+        payloads = [self.broken, self.valid, self.broken]
+        errors = validate_many(payloads, max_workers=2)
+
+        self.assertEqual(len(errors), len(payloads))
+        self.assertIsNone(errors[1])
+        for i in (0, 2):
+            self.assertIsInstance(errors[i], A7PValidationError)
+            self.assertIs(errors[i].payload, payloads[i])
+
+        with self.assertRaises(A7PValidationError) as ctx:
+            validate(self.broken)
+        self.assertEqual(errors[0].all_violations, ctx.exception.all_violations)
+        self.assertEqual(errors[2].all_violations, ctx.exception.all_violations)
+
+    def testEmpty(self):
+        self.assertEqual(validate_many([]), [])
+
+    def testErrorPickle(self):
+        with self.assertRaises(A7PSpecValidationError) as ctx:
+            validate_spec(self.broken)
+        err = ctx.exception
+
+        restored = pickle.loads(pickle.dumps(err))
+        self.assertIs(type(restored), A7PSpecValidationError)
+        self.assertEqual(restored.args, err.args)
+        self.assertEqual(restored.payload, err.payload)
+        self.assertEqual(restored.spec_violations, err.spec_violations)
+        self.assertEqual(restored.all_violations, err.all_violations)
+
+    def testErrorProcessRoundTrip(self):
+        with self.assertRaises(A7PSpecValidationError) as ctx:
+            validate_spec(self.broken)
+        err = ctx.exception
+
+        # the error is pickled to the worker and the copy is pickled back
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            restored = executor.submit(copy.deepcopy, err).result()
+        self.assertIs(type(restored), A7PSpecValidationError)
+        self.assertEqual(restored.payload, self.broken)
+        self.assertEqual(len(restored.spec_violations), 5)
+        self.assertEqual(restored.spec_violations, err.spec_violations)
+
+
+class TestValidCache(TestCase):
+
+    def setUp(self) -> None:
+        _valid_cache.clear()
+
+    def tearDown(self) -> None:
+        _valid_cache.clear()
+
+    def testEvictsLeastRecentlyUsed(self):
+        keys = [b'%d' % i for i in range(_VALID_CACHE_MAXSIZE + 1)]
+        for key in keys[:-1]:
+            _remember_valid(key)
+
+        # a hit makes the entry the most recently used one
+        self.assertTrue(_is_known_valid(keys[0]))
+        _remember_valid(keys[-1])
+
+        self.assertEqual(len(_valid_cache), _VALID_CACHE_MAXSIZE)
+        self.assertTrue(_is_known_valid(keys[0]))
+        self.assertFalse(_is_known_valid(keys[1]))
+        self.assertTrue(_is_known_valid(keys[-1]))
+
+    def testUnknown(self):
+        self.assertFalse(_is_known_valid(b'unknown'))
+
+    def _load_valid(self):
+        with open(TESTS_DIR / "test.a7p", 'rb') as fp:
+            return load(fp, validate_=False)
+
+    def testValidateSkipsKnownPayload(self):
+        payload = self._load_valid()
+        with patch.object(protovalidate, 'collect_violations',
+                          wraps=protovalidate.collect_violations) as collect_violations:
+            validate(payload)
+            self.assertEqual(collect_violations.call_count, 1)
+
+            validate(payload)
+            self.assertEqual(collect_violations.call_count, 1)
+
+            # a mutated payload has a different serialized form, so it is checked again
+            payload.profile.profile_name = payload.profile.profile_name[:-1] + "x"
+            validate(payload)
+            self.assertEqual(collect_violations.call_count, 2)
+
+    def testDumpsRemembersValidPayload(self):
+        payload = self._load_valid()
+        data = dumps(payload)
+        self.assertTrue(_is_known_valid(data[32:]))
@@ -0,0 +1,65 @@
+import asyncio
+import io
+import pickle
+import shutil
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from unittest import TestCase
+
+from a7p import load
+from a7p.__main__ import Result, process_files
+from a7p.exceptions import A7PSpecValidationError
+from a7p.spec_validator import validate_spec
+
+TESTS_DIR = Path(__file__).parent
+
+
+class TestResult(TestCase):
+
+    def testPickle(self):
+        with open(TESTS_DIR / "broken.a7p", 'rb') as fp:
+            payload = load(fp, validate_=False)
+        with self.assertRaises(A7PSpecValidationError) as ctx:
+            validate_spec(payload)
+
+        result = Result(TESTS_DIR / "broken.a7p", validation_error=ctx.exception,
+                        zero=(1.0, 2.0), payload=payload)
+        result.error = "Validation error"
+
+        restored = pickle.loads(pickle.dumps(result))
+        self.assertEqual(restored.path, result.path)
+        self.assertEqual(restored.error, result.error)
+        self.assertEqual(restored.zero, result.zero)
+        self.assertEqual(restored.payload, payload)
+        self.assertEqual(restored.validation_error.spec_violations, ctx.exception.spec_violations)
+
+    def testPickleWithoutPayload(self):
+        restored = pickle.loads(pickle.dumps(Result(TESTS_DIR / "test.a7p")))
+        self.assertIsNone(restored.payload)
+
+
+class TestJobs(TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        for name in ("test.a7p", "bc_ok.a7p", "broken.a7p"):
+            shutil.copy(TESTS_DIR / name, self.tmp_dir / name)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def _run(self, jobs):
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(io.StringIO()):
+            asyncio.run(process_files(path=self.tmp_dir, jobs=jobs))
+        return out.getvalue()
+
+    def testSameAsSerial(self):
+        serial = self._run(1)
+        self.assertIn("Files checked: 3", serial)
+        self.assertEqual(self._run(2), serial)
+
+    def testRejectsZero(self):
+        with self.assertRaises(SystemExit):
+            self._run(0)
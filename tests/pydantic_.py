@@ -0,0 +1,42 @@
+from pathlib import Path
+from unittest import TestCase
+
+from a7p import load
+from a7p.pydantic import validate
+
+TESTS_DIR = Path(__file__).parent
+
+
+class TestTrusted(TestCase):
+
+    def _load(self, name):
+        with open(TESTS_DIR / name, 'rb') as fp:
+            return load(fp, validate_=False)
+
+    def testSkipsValidation(self):
+        payload = self._load("broken.a7p")
+
+        model, restored, violations = validate(payload)
+        self.assertIsNone(model)
+        self.assertTrue(violations)
+
+        model, restored, violations = validate(payload, trusted=True)
+        self.assertEqual(restored, [])
+        self.assertEqual(violations, [])
+        # the invalid values are kept as is
+        self.assertEqual(model.profile.short_name_top, payload.profile.short_name_top)
+        self.assertEqual(model.profile.distances, list(payload.profile.distances))
+
+    def testSkipsRestore(self):
+        model, restored, violations = validate(self._load("broken.a7p"), restore=True, trusted=True)
+        self.assertEqual(restored, [])
+        self.assertEqual(violations, [])
+
+    def testSameAsValidated(self):
+        for name in ("test.a7p", "bc_ok.a7p"):
+            with self.subTest(name):
+                payload = self._load(name)
+                model, _, violations = validate(payload)
+                self.assertEqual(violations, [])
+                trusted_model, _, _ = validate(payload, trusted=True)
+                self.assertEqual(trusted_model.model_dump(), model.model_dump())
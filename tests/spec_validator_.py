@@ -0,0 +1,65 @@
+from pathlib import Path
+from unittest import TestCase
+
+from a7p.spec_validator import SpecValidator, SpecCriterion, _RESOLVED_MAXSIZE
+
+
+def _check_positive(x, *args, **kwargs):
+    return x > 0, "expected positive value"
+
+
+class TestSpecValidatorCache(TestCase):
+
+    def setUp(self) -> None:
+        self.data = {"items": [{"value": -1}, {"value": 1}]}
+
+    def testRegisterAfterValidate(self):
+        v = SpecValidator()
+        self.assertEqual(v.validate(self.data), (True, []))
+
+        v.register("value", _check_positive)
+        is_valid, violations = v.validate(self.data)
+        self.assertFalse(is_valid)
+        self.assertEqual([violation.path for violation in violations], [Path("~/items/[0]/value")])
+
+    def testUnregisterAfterValidate(self):
+        v = SpecValidator()
+        v.register("value", _check_positive)
+        self.assertFalse(v.validate(self.data)[0])
+
+        v.unregister("value")
+        self.assertEqual(v.validate(self.data), (True, []))
+
+    def testCriteriaChangedDirectly(self):
+        v = SpecValidator()
+        self.assertTrue(v.validate(self.data)[0])
+
+        v.criteria["value"] = SpecCriterion(Path("value"), _check_positive)
+        self.assertFalse(v.validate(self.data)[0])
+
+        v.criteria = {"~": v.criteria["~"]}
+        self.assertTrue(v.validate(self.data)[0])
+
+    def testOverriddenGetCriteria(self):
+        criterion = SpecCriterion(Path("value"), _check_positive)
+
+        class Validator(SpecValidator):
+            def get_criteria(self, path):
+                return criterion if path.name == "value" else None
+
+        self.assertFalse(Validator().validate(self.data)[0])
+
+    def testMorePathsThanCacheSize(self):
+        v = SpecValidator()
+        v.register("value", _check_positive)
+        count = _RESOLVED_MAXSIZE * 2 + 1
+        data = {"items": [{"value": -1 if i % 2 else 1} for i in range(count)]}
+
+        is_valid, violations = v.validate(data)
+        self.assertFalse(is_valid)
+        self.assertEqual([violation.path for violation in violations],
+                         [Path(f"~/items/[{i}]/value") for i in range(1, count, 2)])
+        self.assertLessEqual(len(v._resolved), _RESOLVED_MAXSIZE)
+
+        # validating again, with the cache cleared on the way, gives the same result
+        self.assertEqual(v.validate(data)[1], violations)